@@ -6,15 +6,81 @@ from PyQt5.QtGui import QFont, QDoubleValidator
 from PyQt5.QtCore import Qt, pyqtSignal
 import sqlite3
 import csv
+import bisect
+import io
+import os
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+import numpy as np
 import sys
 
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
 DB_NAME = "ai_job.db"
 TABLE_NAME = "jobs"
+AI_JOB_TABLE = "ai_job"
 ADMIN_PASSWORD = "1234"
+# Keeps "IN (...)" lists below SQLite's bound-parameter limit.
+SQL_BATCH_SIZE = 500
+
+# Batch report label -> ai_job column the dataset is partitioned by.
+REPORT_SEGMENTS = {
+    "Industry": "Industry",
+    "Location": "Location",
+    "Risk Level": "AI Impact Level",
+}
+
+SIMILAR_INDEX_FILE = "ai_job_index.npz"
+SIMILAR_INDEX_LOG_TABLE = "ai_job_index_log"
+SIMILAR_FEATURES = [
+    "Median Salary (USD)",
+    "Experience Required (Years)",
+    "Automation Risk (%)",
+    "Remote Work Ratio (%)",
+    "Projected Openings (2030)",
+]
+
+# Column -> Arrow type for columnar export; ai_job stores every value as TEXT,
+# so the numeric columns are cast back in SQL before they reach Arrow.
+COLUMNAR_SCHEMAS = {
+    TABLE_NAME: [
+        ("id", "int64"),
+        ("job_title", "string"),
+        ("category", "string"),
+        ("median_salary", "double"),
+        ("ai_risk", "string"),
+        ("description", "string"),
+    ],
+    AI_JOB_TABLE: [
+        ("Job Title", "string"),
+        ("Industry", "string"),
+        ("Job Status", "string"),
+        ("AI Impact Level", "string"),
+        ("Median Salary (USD)", "double"),
+        ("Required Education", "string"),
+        ("Experience Required (Years)", "int64"),
+        ("Job Openings (2024)", "int64"),
+        ("Projected Openings (2030)", "int64"),
+        ("Remote Work Ratio (%)", "double"),
+        ("Automation Risk (%)", "double"),
+        ("Location", "string"),
+        ("Gender Diversity (%)", "double"),
+    ],
+}
+COLUMNAR_BATCH_SIZE = 65536
 
 
 def get_connection():
@@ -33,6 +99,476 @@ def get_connection():
     return conn
 
 
+def _chunked(items, size=SQL_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _placeholders(items):
+    return ", ".join("?" * len(items))
+
+
+def _fetch_jobs_by_id(cursor, job_ids):
+    rows = []
+    for chunk in _chunked(job_ids):
+        cursor.execute(f"""
+            SELECT id, job_title, category, median_salary, ai_risk, description
+            FROM {TABLE_NAME} WHERE id IN ({_placeholders(chunk)})
+        """, chunk)
+        rows.extend(cursor.fetchall())
+    return sorted(rows)
+
+
+def _draw_pdf_table(c, rows, headers, col_widths, y, continued_title):
+    width, height = letter
+    row_height = 20
+
+    def draw_headers(y):
+        x_offset = 50
+        c.setFont("Helvetica-Bold", 10)
+        for i, header in enumerate(headers):
+            c.drawString(x_offset, y, header)
+            x_offset += col_widths[i]
+        y -= row_height
+        c.line(50, y, width - 50, y)
+        return y - 10
+
+    y = draw_headers(y)
+    c.setFont("Helvetica", 9)
+    for row in rows:
+        if y < 50:
+            c.showPage()
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(50, height - 50, continued_title)
+            y = draw_headers(height - 100)
+            c.setFont("Helvetica", 9)
+
+        x_offset = 50
+        for i, data_item in enumerate(row):
+            display_data = str(data_item) if data_item is not None else "N/A"
+
+            if i in [0, 1] and c.stringWidth(display_data, "Helvetica", 9) > col_widths[i] - 5:
+                lines = []
+                current_line = []
+                words = display_data.split(' ')
+                for word in words:
+                    if c.stringWidth(' '.join(current_line + [word]), "Helvetica", 9) < col_widths[i] - 5:
+                        current_line.append(word)
+                    else:
+                        lines.append(' '.join(current_line))
+                        current_line = [word]
+                lines.append(' '.join(current_line))
+
+                text_y = y
+                for line_part in lines:
+                    c.drawString(x_offset, text_y, line_part)
+                    text_y -= 10
+                if len(lines) > 1:
+                    y -= (len(lines) - 1) * 10
+            else:
+                c.drawString(x_offset, y, display_data)
+            x_offset += col_widths[i]
+        y -= row_height
+
+
+def _segment_report_tasks():
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        sized_tasks = []
+        for label, column in REPORT_SEGMENTS.items():
+            cursor.execute(f'SELECT "{column}", COUNT(*) FROM {AI_JOB_TABLE} WHERE "{column}" IS NOT NULL GROUP BY 1')
+            sized_tasks.extend((count, (label, column, value)) for value, count in cursor.fetchall())
+        # Largest segments first, so the slowest reports don't start last and
+        # leave the other workers idle at the end of the batch.
+        sized_tasks.sort(key=lambda sized_task: sized_task[0], reverse=True)
+        return [task for _, task in sized_tasks]
+    finally:
+        if conn:
+            conn.close()
+
+
+def _render_segment_report(db_name, label, column, value, out_dir):
+    # Runs inside a worker process, so it opens its own connection and draws
+    # with the Agg backend instead of touching Qt.
+    conn = sqlite3.connect(db_name)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT "Job Title", "Industry", "Location", {_columnar_select_expression("Median Salary (USD)", "double")},
+                   {_columnar_select_expression("Automation Risk (%)", "double")}, "AI Impact Level"
+            FROM {AI_JOB_TABLE} WHERE "{column}" = ?
+            ORDER BY "Job Title"
+        """, (value,))
+        jobs = cursor.fetchall()
+    finally:
+        conn.close()
+
+    figure = Figure(figsize=(8, 3))
+    FigureCanvasAgg(figure)
+    ax_risk, ax_salary = figure.subplots(1, 2)
+
+    ax_risk.hist([job[4] for job in jobs if job[4] is not None], bins=20, color="#17A2B8")
+    ax_risk.set_xlabel("Automation Risk (%)", fontsize=9)
+    ax_risk.set_ylabel("Jobs", fontsize=9)
+    ax_risk.set_title("Automation Risk Distribution", fontsize=10)
+
+    if column == "AI Impact Level":
+        # Every row in a risk level segment shares one impact level, so break
+        # salaries down by industry instead.
+        groups = sorted({job[1] for job in jobs if job[1]})
+        group_index, group_label, colors = 1, "Industry", "#17A2B8"
+    else:
+        groups = ["Low", "Moderate", "High"]
+        group_index, group_label, colors = 5, "AI Impact Level", ['#4CAF50', '#FFC107', '#F44336']
+    salary_totals = {group: [0.0, 0] for group in groups}
+    for job in jobs:
+        if job[group_index] in salary_totals and job[3] is not None:
+            salary_totals[job[group_index]][0] += job[3]
+            salary_totals[job[group_index]][1] += 1
+    averages = [total / count if count else 0.0 for total, count in salary_totals.values()]
+    ax_salary.bar(groups, averages, color=colors)
+    ax_salary.set_xlabel(group_label, fontsize=9)
+    ax_salary.set_ylabel("Average Salary (USD)", fontsize=9)
+    ax_salary.set_title(f"Average Salary by {group_label}", fontsize=10)
+    if len(groups) > 3:
+        ax_salary.tick_params(axis="x", labelrotation=45, labelsize=7)
+    figure.tight_layout()
+
+    image = io.BytesIO()
+    figure.savefig(image, format="png", dpi=120)
+    image.seek(0)
+
+    file_name = re.sub(r"[^\w.-]+", "_", f"{label}_{value}") + ".pdf"
+    path = os.path.join(out_dir, file_name)
+    title = f"AI Job Risk Report - {label}: {value}"
+
+    c = canvas.Canvas(path, pagesize=letter)
+    width, height = letter
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(50, height - 50, title)
+    c.setFont("Helvetica", 10)
+    c.drawString(50, height - 68, f"{len(jobs)} jobs")
+    chart_height = (width - 100) * 3 / 8
+    c.drawImage(ImageReader(image), 50, height - 80 - chart_height, width=width - 100, height=chart_height)
+
+    headers = ["Job Title", "Industry", "Location", "Median Salary", "Automation Risk"]
+    col_widths = [180, 90, 70, 90, 80]
+    rows = [(job[0], job[1], job[2], f"{job[3]:.2f}" if job[3] is not None else None,
+             f"{job[4]:.2f}%" if job[4] is not None else None) for job in jobs]
+    _draw_pdf_table(c, rows, headers, col_widths, height - 110 - chart_height, f"{title} (continued)")
+    c.save()
+    return path
+
+
+def _columnar_schema(table):
+    return pa.schema([(column, pa.type_for_alias(arrow_type)) for column, arrow_type in COLUMNAR_SCHEMAS[table]])
+
+
+def _columnar_select_expression(column, arrow_type):
+    if arrow_type == "string":
+        return f'"{column}"'
+    # A bare CAST turns blank or non-numeric TEXT into 0; export those as NULL.
+    value = f'trim("{column}")'
+    numeric = f"{value} GLOB '*[0-9]*' AND {value} NOT GLOB '*[^0-9.eE+-]*'"
+    if arrow_type == "double":
+        return f"CASE WHEN {numeric} THEN CAST({value} AS REAL) END"
+    return (f"CASE WHEN {numeric} AND CAST({value} AS REAL) = CAST({value} AS INTEGER) "
+            f"THEN CAST({value} AS INTEGER) END")
+
+
+def _export_table_columnar(table, path):
+    if pa is None:
+        raise RuntimeError("pyarrow is required for Parquet/Arrow export.")
+    schema = _columnar_schema(table)
+    columns = ", ".join(_columnar_select_expression(column, arrow_type)
+                        for column, arrow_type in COLUMNAR_SCHEMAS[table])
+
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {columns} FROM {table}")
+        if path.lower().endswith(".parquet"):
+            writer = pq.ParquetWriter(path, schema)
+        else:
+            writer = pa.ipc.new_file(path, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+        exported = 0
+        with writer:
+            while True:
+                rows = cursor.fetchmany(COLUMNAR_BATCH_SIZE)
+                if not rows:
+                    break
+                # Transpose each fetched batch straight into Arrow columns.
+                arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+                writer.write_batch(pa.record_batch(arrays, schema=schema))
+                exported += len(rows)
+        return exported
+    finally:
+        if conn:
+            conn.close()
+
+
+def _import_table_columnar(table, path, replace=False):
+    if pa is None:
+        raise RuntimeError("pyarrow is required for Parquet/Arrow import.")
+
+    conn = None
+    # Opening the file ourselves guarantees the handle is released (and not
+    # left locked on Windows) once the import finishes.
+    with pa.OSFile(path, "rb") as source:
+        try:
+            if path.lower().endswith(".parquet"):
+                parquet_file = pq.ParquetFile(source)
+                file_schema = parquet_file.schema_arrow
+                batches = parquet_file.iter_batches(batch_size=COLUMNAR_BATCH_SIZE)
+            else:
+                reader = pa.ipc.open_file(source)
+                file_schema = reader.schema
+                batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+            known = [column for column, _ in COLUMNAR_SCHEMAS[table]]
+            unknown = [name for name in file_schema.names if name not in known]
+            if unknown:
+                raise ValueError(f"Columns {unknown} do not exist in table '{table}'.")
+
+            columns = ", ".join(f'"{name}"' for name in file_schema.names)
+            values = f"VALUES ({_placeholders(file_schema.names)})"
+            # ai_job has no unique key, so duplicates are filtered through a staging table.
+            staged = not replace and table == AI_JOB_TABLE
+            if staged:
+                insert = f"INSERT INTO temp.columnar_import ({columns}) {values}"
+            else:
+                insert = f"INSERT OR IGNORE INTO {table} ({columns}) {values}"
+
+            conn = get_connection()
+            cursor = conn.cursor()
+            if replace:
+                cursor.execute(f"DELETE FROM {table}")
+            if staged:
+                cursor.execute(f"CREATE TEMP TABLE columnar_import AS SELECT {columns} FROM {table} WHERE 0")
+            imported = 0
+            for batch in batches:
+                cursor.executemany(insert, zip(*(column.to_pylist() for column in batch.columns)))
+                imported += cursor.rowcount
+            if staged:
+                # Repeated rows are valid ai_job data, so compare as multisets: the
+                # n-th copy of a row is only skipped if the table already has n copies.
+                matches = " AND ".join(f'file_rows."{name}" IS table_rows."{name}"' for name in file_schema.names)
+                file_columns = ", ".join(f'file_rows."{name}"' for name in file_schema.names)
+                cursor.execute(f"""
+                    INSERT INTO {table} ({columns})
+                    SELECT {file_columns}
+                    FROM (
+                        SELECT {columns}, ROW_NUMBER() OVER (PARTITION BY {columns}) AS copy
+                        FROM temp.columnar_import
+                    ) AS file_rows
+                    LEFT JOIN (
+                        SELECT {columns}, COUNT(*) AS copies FROM {table} GROUP BY {columns}
+                    ) AS table_rows ON {matches}
+                    WHERE file_rows.copy > COALESCE(table_rows.copies, 0)
+                """)
+                imported = cursor.rowcount
+            conn.commit()
+            return imported
+        finally:
+            if conn:
+                conn.close()
+
+
+def _ensure_similar_index_log(conn):
+    # Triggers record every touched ai_job rowid so the persisted index can be
+    # patched with just those rows instead of being rebuilt from scratch.
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {SIMILAR_INDEX_LOG_TABLE} (row_id INTEGER PRIMARY KEY)")
+    for event, refs in (("INSERT", ["NEW"]), ("UPDATE", ["OLD", "NEW"]), ("DELETE", ["OLD"])):
+        inserts = " ".join(f"INSERT OR IGNORE INTO {SIMILAR_INDEX_LOG_TABLE} (row_id) VALUES ({ref}.rowid);"
+                           for ref in refs)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {AI_JOB_TABLE}_index_{event.lower()}
+            AFTER {event} ON {AI_JOB_TABLE}
+            BEGIN {inserts} END
+        """)
+
+
+def _similar_index_log_exists(cursor):
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SIMILAR_INDEX_LOG_TABLE,))
+    return cursor.fetchone() is not None
+
+
+class SimilarJobsIndex:
+    def __init__(self, row_ids, titles, features):
+        self._set_rows(row_ids, titles, features)
+
+    def _set_rows(self, row_ids, titles, features):
+        order = np.argsort(row_ids, kind="stable")
+        self.row_ids = np.asarray(row_ids, dtype=np.int64)[order]
+        self.titles = np.asarray(titles, dtype=str)[order]
+        self.features = np.asarray(features, dtype=np.float64).reshape(-1, len(SIMILAR_FEATURES))[order]
+        self._aggregate()
+
+    def _aggregate(self):
+        # Each title appears in many ai_job rows, so the index holds one averaged
+        # vector per title and compares title to title.
+        keys, first, inverse = np.unique(np.char.lower(self.titles), return_index=True, return_inverse=True)
+        self.title_list = self.titles[first].tolist()
+        self.title_positions = {key: i for i, key in enumerate(keys.tolist())}
+
+        shape = (len(keys), len(SIMILAR_FEATURES))
+        valid = ~np.isnan(self.features)
+        sums = np.zeros(shape)
+        counts = np.zeros(shape)
+        np.add.at(sums, inverse.ravel(), np.where(valid, self.features, 0.0))
+        np.add.at(counts, inverse.ravel(), valid)
+        self.title_features = np.divide(sums, counts, out=np.full(shape, np.nan), where=counts > 0)
+
+        present = ~np.isnan(self.title_features)
+        self.mean = np.divide(np.nansum(self.title_features, axis=0), present.sum(axis=0),
+                              out=np.zeros(shape[1]), where=present.sum(axis=0) > 0)
+        filled = np.where(present, self.title_features, self.mean)
+        scale = filled.std(axis=0) if len(filled) else np.ones(shape[1])
+        self.scale = np.where(scale > 0, scale, 1.0)
+        self.matrix = (filled - self.mean) / self.scale
+        self.sq_norms = np.einsum("ij,ij->i", self.matrix, self.matrix)
+
+    @staticmethod
+    def _fetch_rows(cursor, row_ids=None):
+        columns = ", ".join(_columnar_select_expression(feature, "double") for feature in SIMILAR_FEATURES)
+        query = f'SELECT rowid, "Job Title", {columns} FROM {AI_JOB_TABLE}'
+        if row_ids is None:
+            cursor.execute(query)
+            rows = cursor.fetchall()
+        else:
+            rows = []
+            for chunk in _chunked(row_ids):
+                cursor.execute(f"{query} WHERE rowid IN ({_placeholders(chunk)})", chunk)
+                rows.extend(cursor.fetchall())
+        ids = np.array([row[0] for row in rows], dtype=np.int64)
+        titles = [row[1] or "" for row in rows]
+        features = np.array([[np.nan if v is None else v for v in row[2:]] for row in rows], dtype=np.float64)
+        return ids, titles, features.reshape(-1, len(SIMILAR_FEATURES))
+
+    @classmethod
+    def build(cls, conn, path=SIMILAR_INDEX_FILE):
+        index = cls([], [], [])
+        index._rebuild(conn, path)
+        return index
+
+    @classmethod
+    def load(cls, path=SIMILAR_INDEX_FILE):
+        conn = None
+        try:
+            conn = get_connection()
+            index = None
+            if os.path.exists(path):
+                try:
+                    with np.load(path, allow_pickle=False) as data:
+                        index = cls(data["row_ids"], data["titles"], data["features"])
+                except Exception:
+                    # A truncated or corrupt cache is only a cache; rebuild it.
+                    index = None
+            if index is None:
+                index = cls.build(conn, path)
+            else:
+                index.refresh(conn, path)
+            return index
+        finally:
+            if conn:
+                conn.close()
+
+    def save(self, path=SIMILAR_INDEX_FILE):
+        # Write beside the real file and swap it in, so a crash mid-save never
+        # leaves a half-written index behind.
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez(file, row_ids=self.row_ids, titles=self.titles, features=self.features)
+        os.replace(temp_path, path)
+
+    def _rebuild(self, conn, path=SIMILAR_INDEX_FILE):
+        # The change log is only installed here, so reading the index never
+        # writes to the database unless it has to start over.
+        _ensure_similar_index_log(conn)
+        conn.execute(f"DELETE FROM {SIMILAR_INDEX_LOG_TABLE}")
+        self._set_rows(*self._fetch_rows(conn.cursor()))
+        self.save(path)
+        conn.commit()
+
+    def refresh(self, conn, path=SIMILAR_INDEX_FILE):
+        cursor = conn.cursor()
+        if not _similar_index_log_exists(cursor):
+            # The database was replaced since the index was saved.
+            self._rebuild(conn, path)
+            return True
+
+        cursor.execute(f"SELECT row_id FROM {SIMILAR_INDEX_LOG_TABLE}")
+        changed = [row[0] for row in cursor.fetchall()]
+        if changed:
+            ids, titles, features = self._fetch_rows(cursor, changed)
+            keep = ~np.isin(self.row_ids, changed)
+            self._set_rows(np.concatenate([self.row_ids[keep], ids]),
+                           np.concatenate([self.titles[keep], np.asarray(titles, dtype=str)]),
+                           np.concatenate([self.features[keep], features]))
+
+        cursor.execute(f"SELECT COUNT(*), MAX(rowid) FROM {AI_JOB_TABLE}")
+        count, max_row_id = cursor.fetchone()
+        if count != len(self.row_ids) or (count and max_row_id != self.row_ids[-1]):
+            # Rowids were renumbered (e.g. VACUUM) or rows changed without being logged.
+            self._rebuild(conn, path)
+            return True
+        if not changed:
+            return False
+
+        # Save before clearing the log so a crash in between only re-applies
+        # the same changes on the next load.
+        self.save(path)
+        for chunk in _chunked(changed):
+            cursor.execute(f"DELETE FROM {SIMILAR_INDEX_LOG_TABLE} WHERE row_id IN ({_placeholders(chunk)})", chunk)
+        conn.commit()
+        return True
+
+    def vector_for(self, job_title, median_salary=None):
+        position = self.title_positions.get(job_title.lower())
+        if position is not None:
+            return self.matrix[position]
+        if median_salary is None:
+            return None
+        # Jobs missing from ai_job are placed at the dataset mean except for salary.
+        vector = np.zeros(len(SIMILAR_FEATURES))
+        vector[0] = (median_salary - self.mean[0]) / self.scale[0]
+        return vector
+
+    def query(self, vector, k=5, exclude_title=None):
+        distances = self.sq_norms - 2 * (self.matrix @ vector) + vector @ vector
+        excluded = self.title_positions.get(exclude_title.lower()) if exclude_title else None
+        if excluded is not None:
+            distances[excluded] = np.inf
+        k = min(k, len(distances) - (excluded is not None))
+        if k <= 0:
+            return []
+        order = np.argpartition(distances, k - 1)[:k]
+        order = order[np.argsort(distances[order])]
+        return [(self.title_list[i], self.title_features[i], float(np.sqrt(max(distances[i], 0.0))))
+                for i in order.tolist()]
+
+
+_similar_jobs_index = None
+
+
+def get_similar_jobs_index():
+    global _similar_jobs_index
+    if _similar_jobs_index is None:
+        _similar_jobs_index = SimilarJobsIndex.load()
+    else:
+        conn = None
+        try:
+            conn = get_connection()
+            _similar_jobs_index.refresh(conn)
+        finally:
+            if conn:
+                conn.close()
+    return _similar_jobs_index
+
+
 class AddJobDialog(QtWidgets.QDialog):
     job_added = QtCore.pyqtSignal()
 
@@ -182,6 +718,80 @@ class EditJobDialog(QtWidgets.QDialog):
 
 
 
+class BatchEditJobDialog(QtWidgets.QDialog):
+    jobs_updated = QtCore.pyqtSignal(list, dict)
+
+    UNCHANGED = "(unchanged)"
+
+    def __init__(self, job_ids):
+        super().__init__()
+        self.job_ids = job_ids
+        self.setWindowTitle(f"Edit {len(job_ids)} Jobs")
+        self.setFixedSize(400, 200)
+
+        layout = QtWidgets.QFormLayout()
+
+        self.category_input = QtWidgets.QComboBox()
+        self.category_input.addItems([self.UNCHANGED, "IT", "Design", "Healthcare", "Education", "Engineering", "Other"])
+        self.salary_input = QtWidgets.QLineEdit()
+        self.salary_input.setPlaceholderText(self.UNCHANGED)
+        self.salary_input.setValidator(QtGui.QDoubleValidator(0, 1000000, 2))
+        self.risk_input = QtWidgets.QComboBox()
+        self.risk_input.addItems([self.UNCHANGED, "Low", "Medium", "High"])
+
+        layout.addRow("Selected Jobs:", QtWidgets.QLabel(str(len(job_ids))))
+        layout.addRow("Category:", self.category_input)
+        layout.addRow("Median Salary:", self.salary_input)
+        layout.addRow("AI Risk:", self.risk_input)
+
+        self.btn = QtWidgets.QPushButton("Update All")
+        self.btn.clicked.connect(self.update_jobs)
+        layout.addRow(self.btn)
+        self.setLayout(layout)
+
+    def update_jobs(self):
+        changes = {}
+        if self.category_input.currentText() != self.UNCHANGED:
+            changes["category"] = self.category_input.currentText()
+        if self.salary_input.text().strip():
+            try:
+                changes["median_salary"] = float(self.salary_input.text())
+            except ValueError:
+                QtWidgets.QMessageBox.warning(self, "Input Error", "Median salary must be a number.")
+                return
+        if self.risk_input.currentText() != self.UNCHANGED:
+            changes["ai_risk"] = self.risk_input.currentText()
+
+        if not changes:
+            QtWidgets.QMessageBox.warning(self, "No Changes", "Choose at least one field to update.")
+            return
+
+        assignments = ", ".join(f"{column} = ?" for column in changes)
+        conn = None
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
+            previous_rows = _fetch_jobs_by_id(cursor, self.job_ids)
+            for chunk in _chunked(self.job_ids):
+                cursor.execute(f"UPDATE {TABLE_NAME} SET {assignments} WHERE id IN ({_placeholders(chunk)})",
+                               list(changes.values()) + list(chunk))
+            conn.commit()
+
+            QtWidgets.QMessageBox.information(self, "Updated", f"{len(previous_rows)} jobs updated successfully.")
+            self.jobs_updated.emit(previous_rows, changes)
+            self.close()
+
+        except sqlite3.OperationalError as e:
+            QtWidgets.QMessageBox.critical(self, "Database Error",
+                                           f"SQL Error: {e}\nPlease ensure your database schema (table: {TABLE_NAME}) matches the column names.")
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", f"An unexpected error occurred: {e}")
+        finally:
+            if conn:
+                conn.close()
+
+
+
 class InfoWindow(QtWidgets.QWidget):
     def __init__(self, job_data):
         super().__init__()
@@ -200,8 +810,28 @@ class InfoWindow(QtWidgets.QWidget):
         label.setWordWrap(True)
         label.setStyleSheet("font-size: 14px; color: black;")
         layout.addWidget(label)
+
+        similar_label = QtWidgets.QLabel(self._similar_jobs_text(job_data))
+        similar_label.setWordWrap(True)
+        similar_label.setStyleSheet("font-size: 13px; color: black;")
+        layout.addWidget(similar_label)
         self.setLayout(layout)
 
+    def _similar_jobs_text(self, job_data, k=5):
+        try:
+            index = get_similar_jobs_index()
+            vector = index.vector_for(job_data["job_title"], job_data["median_salary"])
+            similar = index.query(vector, k, exclude_title=job_data["job_title"]) if vector is not None else []
+        except Exception as e:
+            return f"<b>Similar Jobs:</b> unavailable ({e})"
+
+        if not similar:
+            return "<b>Similar Jobs:</b> not enough data to compare."
+        items = "".join(
+            f"<li>{title} - salary {features[0]:.0f}, automation risk {features[2]:.1f}%</li>"
+            for title, features, _ in similar)
+        return f"<b>Similar Jobs:</b><ol>{items}</ol>"
+
 
 
 class ChartWindow(QtWidgets.QDialog):
@@ -270,6 +900,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(self.centralwidget)
         self.main_layout = QtWidgets.QVBoxLayout(self.centralwidget)
 
+        # ("delete" | "update", rows as they were before the last batch operation)
+        self._undo_batch = None
+
         self._setup_ui_elements()
         self._setup_table_and_buttons()
         self.refresh_job_list()
@@ -376,6 +1009,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.pushButton_delete.setEnabled(False)
         admin_buttons_layout.addWidget(self.pushButton_delete)
 
+        self.pushButton_undo = QtWidgets.QPushButton("Undo", self.centralwidget)
+        self.pushButton_undo.setStyleSheet("background-color: #6C757D; color: white;")
+        self.pushButton_undo.clicked.connect(self.undo_batch)
+        self.pushButton_undo.setEnabled(False)
+        admin_buttons_layout.addWidget(self.pushButton_undo)
+
         self.main_layout.addLayout(admin_buttons_layout)
         self.main_layout.addStretch()
 
@@ -386,6 +1025,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.table.setHorizontalHeaderLabels(["ID", "Job Title", "Category", "Median Salary", "AI Risk"])
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setStyleSheet("background-color: white; color: black;")
         self.main_layout.addWidget(self.table)
@@ -404,10 +1044,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.pushButton_export_pdf.clicked.connect(self.export_pdf)
         bottom_buttons_layout.addWidget(self.pushButton_export_pdf)
 
+        self.pushButton_batch_reports = QtWidgets.QPushButton("Batch Reports", self.centralwidget)
+        self.pushButton_batch_reports.setStyleSheet("background-color: #6C757D; color: white;")
+        self.pushButton_batch_reports.clicked.connect(self.export_batch_reports)
+        bottom_buttons_layout.addWidget(self.pushButton_batch_reports)
+
         self.pushButton_export_csv = QtWidgets.QPushButton("Export CSV", self.centralwidget)
         self.pushButton_export_csv.setStyleSheet("background-color: #6C757D; color: white;")
         self.pushButton_export_csv.clicked.connect(self.export_csv)
         bottom_buttons_layout.addWidget(self.pushButton_export_csv)
+
+        self.pushButton_export_columnar = QtWidgets.QPushButton("Export Parquet", self.centralwidget)
+        self.pushButton_export_columnar.setStyleSheet("background-color: #6C757D; color: white;")
+        self.pushButton_export_columnar.clicked.connect(self.export_columnar)
+        bottom_buttons_layout.addWidget(self.pushButton_export_columnar)
+
+        self.pushButton_import_columnar = QtWidgets.QPushButton("Import Parquet", self.centralwidget)
+        self.pushButton_import_columnar.setStyleSheet("background-color: #6C757D; color: white;")
+        self.pushButton_import_columnar.clicked.connect(self.import_columnar)
+        bottom_buttons_layout.addWidget(self.pushButton_import_columnar)
         bottom_buttons_layout.addStretch()
 
         self.main_layout.addLayout(bottom_buttons_layout)
@@ -430,18 +1085,19 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def refresh_job_list(self):
 
+        # Every full reload follows a change made outside the batch operations
+        # (add, single edit, import), so the batch snapshot may be stale.
+        self._set_undo_batch(None)
         conn = None
         try:
             conn = get_connection()
             cursor = conn.cursor()
-            cursor.execute(f"SELECT id, job_title, category, median_salary, ai_risk FROM {TABLE_NAME}")
+            cursor.execute(f"SELECT id, job_title, category, median_salary, ai_risk FROM {TABLE_NAME} ORDER BY id")
             rows = cursor.fetchall()
 
             self.table.setRowCount(len(rows))
             for r, row in enumerate(rows):
-                for c, val in enumerate(row):
-                    item = QtWidgets.QTableWidgetItem(str(val) if val is not None else "N/A")
-                    self.table.setItem(r, c, item)
+                self._set_table_row(r, row)
             self.table.resizeColumnsToContents()
             self.table.horizontalHeader().setStretchLastSection(True)
             self._populate_job_titles_combo_box()
@@ -451,6 +1107,47 @@ class MainWindow(QtWidgets.QMainWindow):
             if conn:
                 conn.close()
 
+    def _set_table_row(self, r, row):
+        for c, val in enumerate(row):
+            item = QtWidgets.QTableWidgetItem(str(val) if val is not None else "N/A")
+            self.table.setItem(r, c, item)
+
+    def _table_job_ids(self):
+        return [int(self.table.item(r, 0).text()) for r in range(self.table.rowCount())]
+
+    def _selected_job_ids(self):
+        job_ids = []
+        for index in self.table.selectionModel().selectedRows():
+            job_id_item = self.table.item(index.row(), 0)
+            if job_id_item is not None:
+                job_ids.append(int(job_id_item.text()))
+        return sorted(job_ids)
+
+    def _remove_table_rows(self, job_ids):
+        removed = set(job_ids)
+        for r, job_id in reversed(list(enumerate(self._table_job_ids()))):
+            if job_id in removed:
+                self.table.removeRow(r)
+
+    def _insert_table_rows(self, rows):
+        # Rows are kept in id order, so restored jobs go back where they were.
+        table_ids = self._table_job_ids()
+        for row in sorted(rows):
+            r = bisect.bisect_left(table_ids, row[0])
+            self.table.insertRow(r)
+            self._set_table_row(r, row[:5])
+            table_ids.insert(r, row[0])
+
+    def _update_table_rows(self, rows):
+        rows_by_id = {row[0]: row for row in rows}
+        for r, job_id in enumerate(self._table_job_ids()):
+            if job_id in rows_by_id:
+                self._set_table_row(r, rows_by_id[job_id][:5])
+
+    def _set_undo_batch(self, undo_batch):
+        self._undo_batch = undo_batch
+        self.pushButton_undo.setEnabled(undo_batch is not None and self.pushButton_delete.isEnabled())
+
     def search_job(self):
 
         search_term = self.comboBox.currentText().strip()
@@ -495,24 +1192,22 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def edit_job(self):
 
-        sel_row = self.table.currentRow()
-        if sel_row < 0:
-            QtWidgets.QMessageBox.warning(self, "No selection", "Select a job to edit.")
-            return
-
-
-        job_id_item = self.table.item(sel_row, 0)
-        if job_id_item is None:
-            QtWidgets.QMessageBox.warning(self, "Error", "Could not retrieve job ID for editing.")
-            return
-
         try:
-            job_id = int(job_id_item.text())
+            job_ids = self._selected_job_ids()
         except ValueError:
             QtWidgets.QMessageBox.warning(self, "Error", "Invalid Job ID.")
             return
+        if not job_ids:
+            QtWidgets.QMessageBox.warning(self, "No selection", "Select one or more jobs to edit.")
+            return
 
+        if len(job_ids) > 1:
+            dlg = BatchEditJobDialog(job_ids)
+            dlg.jobs_updated.connect(self._on_jobs_updated)
+            dlg.exec_()
+            return
 
+        job_id = job_ids[0]
         current_data = {}
         conn = None
         try:
@@ -545,44 +1240,97 @@ class MainWindow(QtWidgets.QMainWindow):
         dlg.job_updated.connect(self.refresh_job_list)
         dlg.exec_()
 
-    def delete_job(self):
+    def _on_jobs_updated(self, previous_rows, changes):
+        columns = ["id", "job_title", "category", "median_salary", "ai_risk", "description"]
+        updated_rows = []
+        for row in previous_rows:
+            row = list(row)
+            for column, value in changes.items():
+                row[columns.index(column)] = value
+            updated_rows.append(row)
+        self._update_table_rows(updated_rows)
+        self._set_undo_batch(("update", previous_rows))
 
-        sel_row = self.table.currentRow()
-        if sel_row < 0:
-            QtWidgets.QMessageBox.warning(self, "No selection", "Select a job to delete.")
-            return
-
-
-        job_id_item = self.table.item(sel_row, 0)
-        job_title_display = self.table.item(sel_row, 1).text()
-        if job_id_item is None:
-            QtWidgets.QMessageBox.warning(self, "Error", "Could not retrieve job ID for deletion.")
-            return
+    def delete_job(self):
 
         try:
-            job_id = int(job_id_item.text())
+            job_ids = self._selected_job_ids()
         except ValueError:
             QtWidgets.QMessageBox.warning(self, "Error", "Invalid Job ID selected for deletion.")
             return
+        if not job_ids:
+            QtWidgets.QMessageBox.warning(self, "No selection", "Select one or more jobs to delete.")
+            return
+
+        if len(job_ids) == 1:
+            job_title_display = self.table.item(self.table.selectionModel().selectedRows()[0].row(), 1).text()
+            question = f"Are you sure you want to delete '{job_title_display}' (ID: {job_ids[0]})?"
+        else:
+            question = f"Are you sure you want to delete {len(job_ids)} selected jobs?"
 
-        reply = QtWidgets.QMessageBox.question(self, "Confirm Deletion",
-                                               f"Are you sure you want to delete '{job_title_display}' (ID: {job_id})?",
+        reply = QtWidgets.QMessageBox.question(self, "Confirm Deletion", question,
                                                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
         if reply == QtWidgets.QMessageBox.Yes:
             conn = None
             try:
                 conn = get_connection()
                 cursor = conn.cursor()
-                cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE id = ?", (job_id,))
+                deleted_rows = _fetch_jobs_by_id(cursor, job_ids)
+                for chunk in _chunked(job_ids):
+                    cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE id IN ({_placeholders(chunk)})", chunk)
                 conn.commit()
-                QtWidgets.QMessageBox.information(self, "Deleted", f"'{job_title_display}' deleted successfully!")
-                self.refresh_job_list()
             except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Failed to delete job: {e}")
+                QtWidgets.QMessageBox.critical(self, "Error", f"Failed to delete jobs: {e}")
+                return
             finally:
                 if conn:
                     conn.close()
 
+            self._remove_table_rows(job_ids)
+            self._populate_job_titles_combo_box()
+            self._set_undo_batch(("delete", deleted_rows))
+            QtWidgets.QMessageBox.information(self, "Deleted", f"{len(deleted_rows)} job(s) deleted successfully!")
+
+    def undo_batch(self):
+
+        if self._undo_batch is None:
+            return
+        action, rows = self._undo_batch
+
+        conn = None
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
+            if action == "delete":
+                cursor.executemany(f"""
+                    INSERT INTO {TABLE_NAME} (id, job_title, category, median_salary, ai_risk, description)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, rows)
+            else:
+                cursor.executemany(f"""
+                    UPDATE {TABLE_NAME} SET category = ?, median_salary = ?, ai_risk = ?, description = ?
+                    WHERE id = ?
+                """, [(row[2], row[3], row[4], row[5], row[0]) for row in rows])
+            conn.commit()
+        except sqlite3.IntegrityError as e:
+            QtWidgets.QMessageBox.critical(self, "Undo Failed",
+                                           f"Could not restore the previous batch because it conflicts with newer data: {e}")
+            return
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to undo: {e}")
+            return
+        finally:
+            if conn:
+                conn.close()
+
+        if action == "delete":
+            self._insert_table_rows(rows)
+            self._populate_job_titles_combo_box()
+        else:
+            self._update_table_rows(rows)
+        self._set_undo_batch(None)
+        QtWidgets.QMessageBox.information(self, "Undone", f"Restored {len(rows)} job(s).")
+
     def open_chart(self):
         self.chart_win = ChartWindow()
         self.chart_win.show()
@@ -607,6 +1355,53 @@ class MainWindow(QtWidgets.QMainWindow):
                 if conn:
                     conn.close()
 
+    def _choose_columnar_table(self, title):
+        if pa is None:
+            QtWidgets.QMessageBox.warning(self, "Missing Dependency",
+                                          "Install pyarrow to export or import Parquet/Arrow files.")
+            return None
+        table, ok = QtWidgets.QInputDialog.getItem(self, title, "Table:", list(COLUMNAR_SCHEMAS), 0, False)
+        return table if ok else None
+
+    def export_columnar(self):
+        table = self._choose_columnar_table("Export Parquet/Arrow")
+        if not table:
+            return
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save Columnar File", f"{table}.parquet",
+                                                        "Parquet Files (*.parquet);;Arrow IPC Files (*.arrow)")
+        if path:
+            try:
+                exported = _export_table_columnar(table, path)
+                QtWidgets.QMessageBox.information(self, "Success", f"{exported} rows from '{table}' exported to:\n{path}")
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "Error", f"Failed to export '{table}': {e}")
+
+    def import_columnar(self):
+        table = self._choose_columnar_table("Import Parquet/Arrow")
+        if not table:
+            return
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open Columnar File", "",
+                                                        "Parquet Files (*.parquet);;Arrow IPC Files (*.arrow)")
+        if path:
+            choice = QtWidgets.QMessageBox(self)
+            choice.setWindowTitle("Import Mode")
+            choice.setText(f"Replace all rows in '{table}' or add only rows that are not already there?")
+            replace_button = choice.addButton("Replace Existing", QtWidgets.QMessageBox.DestructiveRole)
+            skip_button = choice.addButton("Skip Duplicates", QtWidgets.QMessageBox.AcceptRole)
+            choice.addButton(QtWidgets.QMessageBox.Cancel)
+            choice.exec_()
+            if choice.clickedButton() not in (replace_button, skip_button):
+                return
+
+            try:
+                imported = _import_table_columnar(table, path, replace=choice.clickedButton() is replace_button)
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "Error", f"Failed to import into '{table}': {e}")
+                return
+            if table == TABLE_NAME:
+                self.refresh_job_list()
+            QtWidgets.QMessageBox.information(self, "Success", f"{imported} rows imported into '{table}'.")
+
     def export_pdf(self):
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save PDF", "ai_jobs_report.pdf", "PDF Files (*.pdf)")
         if path:
@@ -623,22 +1418,9 @@ class MainWindow(QtWidgets.QMainWindow):
         c.setFont("Helvetica-Bold", 16)
         c.drawString(50, height - 50, "AI Job Risk Report")
 
-        y = height - 100
-        row_height = 20
-
         headers = ["Job Title", "Category", "Median Salary", "AI Risk"]
         col_widths = [200, 100, 100, 80]
 
-        x_offset = 50
-        c.setFont("Helvetica-Bold", 10)
-        for i, header in enumerate(headers):
-            c.drawString(x_offset, y, header)
-            x_offset += col_widths[i]
-
-        y -= row_height
-        c.line(50, y, width - 50, y)
-        y -= 10
-
         conn = None
         try:
             conn = get_connection()
@@ -646,49 +1428,7 @@ class MainWindow(QtWidgets.QMainWindow):
             cursor.execute(f"SELECT job_title, category, median_salary, ai_risk FROM {TABLE_NAME}")
             jobs = cursor.fetchall()
 
-            c.setFont("Helvetica", 9)
-            for job in jobs:
-                if y < 50:
-                    c.showPage()
-                    c.setFont("Helvetica-Bold", 16)
-                    c.drawString(50, height - 50, "AI Job Risk Report (continued)")
-                    y = height - 100
-                    x_offset = 50
-                    c.setFont("Helvetica-Bold", 10)
-                    for i, header in enumerate(headers):
-                        c.drawString(x_offset, y, header)
-                        x_offset += col_widths[i]
-                    y -= row_height
-                    c.line(50, y, width - 50, y)
-                    y -= 10
-                    c.setFont("Helvetica", 9)
-
-                x_offset = 50
-                for i, data_item in enumerate(job):
-                    display_data = str(data_item) if data_item is not None else "N/A"
-
-                    if i in [0, 1] and c.stringWidth(display_data, "Helvetica", 9) > col_widths[i] - 5:
-                        lines = []
-                        current_line = []
-                        words = display_data.split(' ')
-                        for word in words:
-                            if c.stringWidth(' '.join(current_line + [word]), "Helvetica", 9) < col_widths[i] - 5:
-                                current_line.append(word)
-                            else:
-                                lines.append(' '.join(current_line))
-                                current_line = [word]
-                        lines.append(' '.join(current_line))
-
-                        text_y = y
-                        for line_part in lines:
-                            c.drawString(x_offset, text_y, line_part)
-                            text_y -= 10
-                        if len(lines) > 1:
-                            y -= (len(lines) - 1) * 10
-                    else:
-                        c.drawString(x_offset, y, display_data)
-                    x_offset += col_widths[i]
-                y -= row_height
+            _draw_pdf_table(c, jobs, headers, col_widths, height - 100, "AI Job Risk Report (continued)")
         except Exception as e:
             raise Exception(f"Error generating PDF content: {e}")
         finally:
@@ -696,6 +1436,68 @@ class MainWindow(QtWidgets.QMainWindow):
                 conn.close()
         c.save()
 
+    def export_batch_reports(self):
+        out_dir = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Folder for Segment Reports")
+        if not out_dir:
+            return
+
+        try:
+            tasks = _segment_report_tasks()
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to read report segments: {e}")
+            return
+
+        progress = QtWidgets.QProgressDialog("Generating segment reports...", "Cancel", 0, len(tasks), self)
+        progress.setWindowTitle("Batch Reports")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+
+        errors = []
+        completed = 0
+        # Spawned workers never inherit the running Qt application state.
+        pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = {pool.submit(_render_segment_report, DB_NAME, label, column, value, out_dir): (label, value)
+                       for label, column, value in tasks}
+            pending = set(futures)
+            while pending and not progress.wasCanceled():
+                finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        label, value = futures[future]
+                        errors.append(f"{label} '{value}': {e}")
+                    completed += 1
+                progress.setValue(completed)
+                QtWidgets.QApplication.processEvents()
+            cancelled = progress.wasCanceled()
+            if cancelled:
+                # Drop the queued reports, then keep the window responsive while
+                # the ones already rendering finish.
+                pool.shutdown(wait=False, cancel_futures=True)
+                progress.setCancelButton(None)
+                progress.setLabelText("Cancelling... waiting for running reports to finish.")
+                progress.setRange(0, 0)
+                progress.show()
+                while not all(future.done() for future in pending):
+                    wait(pending, timeout=0.1)
+                    QtWidgets.QApplication.processEvents()
+                completed = sum(1 for future in futures if future.done() and not future.cancelled())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            progress.close()
+
+        if cancelled:
+            QtWidgets.QMessageBox.information(self, "Cancelled",
+                                              f"Batch export cancelled after {completed} of {len(tasks)} reports.")
+        elif errors:
+            QtWidgets.QMessageBox.warning(self, "Partial Export",
+                                          f"{len(errors)} of {len(tasks)} reports failed:\n" + "\n".join(errors))
+        else:
+            QtWidgets.QMessageBox.information(self, "Success", f"{len(tasks)} segment reports exported to:\n{out_dir}")
+
     def toggle_admin_ui(self):
 
         is_checked = self.radioButton_permission.isChecked()
@@ -709,6 +1511,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.pushButton_add.setEnabled(False)
             self.pushButton_edit.setEnabled(False)
             self.pushButton_delete.setEnabled(False)
+            self.pushButton_undo.setEnabled(False)
 
     def verify_password(self):
 
@@ -721,6 +1524,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.pushButton_add.setEnabled(True)
             self.pushButton_edit.setEnabled(True)
             self.pushButton_delete.setEnabled(True)
+            self.pushButton_undo.setEnabled(self._undo_batch is not None)
         else:
             self.label_password_status.setText("❌ Wrong password")
             self.label_password_status.setStyleSheet("color: #DC3545;")
@@ -731,6 +1535,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.pushButton_add.setEnabled(False)
             self.pushButton_edit.setEnabled(False)
             self.pushButton_delete.setEnabled(False)
+            self.pushButton_undo.setEnabled(False)
 
 
 if __name__ == "__main__":